@@ -0,0 +1,32 @@
+"""
+Caching Helpers
+Small in-process caches for values that are polled far more often than they change.
+"""
+
+import functools
+import time
+
+
+def async_ttl_cache(ttl: float = 1.0):
+    """Memoize an async function's result per argument set for `ttl` seconds.
+
+    The wrapped function gets a `cache_clear()` method to drop all entries,
+    e.g. after an action that is known to change the result.
+    """
+    def decorator(fn):
+        entries = {}  # { key: (value, expires_at) }
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = entries.get(key)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+            value = await fn(*args, **kwargs)
+            entries[key] = (value, time.monotonic() + ttl)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
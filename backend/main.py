@@ -10,7 +10,12 @@ import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
 import re
+import signal
+import socket
+import time
 
 from dotenv import load_dotenv
 
@@ -20,30 +25,49 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 import httpx
+import orjson
 
 from monitoring import get_all_stats, get_cpu_stats, get_memory_stats, get_gpu_stats
-from vllm_service import get_vllm_service
+from vllm_service import get_vllm_service, shutdown_vllm_service, valid_messages
+from cache import async_ttl_cache
 
 
 # Configuration
 VLLM_URL = os.getenv("VLLM_URL", "http://localhost:8001")
 BACKEND_PORT = int(os.getenv("BACKEND_PORT", 5111))
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
+HF_CACHE_DIR = Path(os.path.expanduser("~/.cache/huggingface/hub"))
+STATS_INTERVAL = 1.5  # seconds between monitoring broadcasts
+DISK_REFRESH_TICKS = 10  # refresh disk usage every N broadcasts
+PORT_PROBE_TTL = 2.0  # seconds to trust a "port not listening yet" probe
+
+# Where VLLM_URL points, to tell whether it is one of the managed servers
+_vllm_url = urlsplit(VLLM_URL)
+VLLM_URL_PORT = _vllm_url.port or (443 if _vllm_url.scheme == "https" else 80)
+VLLM_URL_IS_LOCAL = _vllm_url.hostname in ("localhost", "127.0.0.1", "::1")
+
+# Shared client for talking to managed vLLM instances (keep-alive across requests)
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=32)
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
     print("🚀 VLLM Dashboard starting...")
+    broadcaster = asyncio.create_task(monitoring_broadcaster())
     yield
     # Cleanup
+    broadcaster.cancel()
     print("🛑 Shutting down managed vLLM processes...")
     await vllm_manager.stop_server() # Terminates all running models
     
-    vllm = get_vllm_service(VLLM_URL)
-    await vllm.close()
+    await shutdown_vllm_service()
+    await HTTP_CLIENT.aclose()
     print("👋 VLLM Dashboard shutting down...")
 
 
@@ -75,50 +99,59 @@ class VLLMManager:
         self.processes = {}  # { model_name: {'process': proc, 'port': int, 'status': str} }
         self.vllm_path = "/home/sinergi/AI/vllm/venv/bin/vllm"
         self.base_port = 8001
+        self._port_free_until = {}  # { port: monotonic deadline } for recent "not listening yet" probes
         self._discover_running_processes()
     
     def _discover_running_processes(self):
         """Discover existing vLLM processes running on the system."""
         print("🔍 Scanning for existing vLLM processes...")
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'ppid']):
+            # Walk /proc directly and read only each cmdline; psutil.process_iter
+            # would open several files for every process on the system.
+            with os.scandir('/proc') as entries:
+                pids = [entry.name for entry in entries if entry.name.isdigit()]
+            for pid_str in pids:
+                try:
+                    with open(f'/proc/{pid_str}/cmdline', 'rb') as f:
+                        data = f.read()
+                except OSError:
+                    continue
+                if b'vllm' not in data and b'VLLM::EngineCore' not in data:
+                    continue
+                
+                pid = int(pid_str)
+                cmdline = [arg.decode(errors='replace') for arg in data.rstrip(b'\0').split(b'\0')]
                 try:
-                    cmdline = proc.info['cmdline']
-                    name = proc.info['name']
-                    pid = proc.info['pid']
-                    
                     # 1. Check for standard "vllm serve" processes
-                    cmd_str = ' '.join(cmdline) if cmdline else name
-                    if 'vllm' in cmd_str:
-                        # Stricter check: 'serve' must be a distinct argument
-                        if 'serve' in cmdline:
-                            model_name = "Unknown"
-                            port = 8001
-                            for i, arg in enumerate(cmdline):
-                                if arg == 'serve' and i + 1 < len(cmdline):
-                                    model_name = cmdline[i+1]
-                                if arg == '--port' and i + 1 < len(cmdline):
-                                    try: port = int(cmdline[i+1])
-                                    except: pass
-                            
-                            display_name = model_name
-                            if model_name == "Unknown":
-                                display_name = f"Unknown (PID:{pid})"
-                            
-                            print(f"✅ Found running vLLM: {display_name} on port {port}")
-                            self.processes[display_name] = {
-                                'process': proc,
-                                'port': port,
-                                'status': 'running'
-                            }
-                            continue
+                    # Stricter check: 'serve' must be a distinct argument
+                    if b'vllm' in data and 'serve' in cmdline:
+                        model_name = "Unknown"
+                        port = 8001
+                        for i, arg in enumerate(cmdline):
+                            if arg == 'serve' and i + 1 < len(cmdline):
+                                model_name = cmdline[i+1]
+                            if arg == '--port' and i + 1 < len(cmdline):
+                                try: port = int(cmdline[i+1])
+                                except: pass
+                        
+                        display_name = model_name
+                        if model_name == "Unknown":
+                            display_name = f"Unknown (PID:{pid})"
+                        
+                        print(f"✅ Found running vLLM: {display_name} on port {port}")
+                        self.processes[display_name] = {
+                            'process': psutil.Process(pid),
+                            'port': port,
+                            'status': 'running'
+                        }
+                        continue
 
                     # 2. Check for "VLLM::EngineCore" orphans (Zombies)
-                    if 'VLLM::EngineCore' in cmd_str or 'VLLM::EngineCore' in name:
-                         if proc.info['ppid'] == 1:
+                    if b'VLLM::EngineCore' in data:
+                         if self._read_ppid(pid) == 1:
                              print(f"💀 Found Zombie vLLM Worker: PID {pid}")
                              self.processes[f"Zombie Process ({pid})"] = {
-                                'process': proc,
+                                'process': psutil.Process(pid),
                                 'port': 'N/A',
                                 'status': 'zombie'
                             }
@@ -127,12 +160,34 @@ class VLLMManager:
         except Exception as e:
             print(f"Error discovering processes: {e}")
     
+    @staticmethod
+    def _read_ppid(pid: int):
+        """Parent PID from /proc/<pid>/status, or None if it can't be read."""
+        try:
+            # PPid sits in the first few lines, well within 512 bytes
+            with open(f'/proc/{pid}/status', 'rb') as f:
+                head = f.read(512)
+        except OSError:
+            return None
+        start = head.find(b'PPid:\t')
+        if start == -1:
+            return None
+        end = head.find(b'\n', start)
+        try:
+            return int(head[start + 6:end if end != -1 else None])
+        except ValueError:
+            return None
+
     def _is_port_in_use(self, port: int) -> bool:
+        # Binding fails immediately with EADDRINUSE if someone is listening,
+        # without waiting on a TCP handshake like a connect() probe would.
         try:
-            import socket
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                return s.connect_ex(('localhost', port)) == 0
-        except:
+                s.setblocking(False)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                s.bind(('127.0.0.1', port))
+                return False
+        except OSError:
             return True
 
     def _get_next_free_port(self) -> int:
@@ -141,6 +196,21 @@ class VLLMManager:
             port += 1
         return port
 
+    def _kill_port_listeners(self, port) -> None:
+        """Kill any leftover process still listening on the given port."""
+        if not isinstance(port, int):
+            return
+        try:
+            for conn in psutil.net_connections(kind='inet'):
+                if (conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN
+                        and conn.pid and conn.pid != os.getpid()):
+                    try:
+                        psutil.Process(conn.pid).kill()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
+        except Exception as e:
+            print(f"Port cleanup failed for {port}: {e}")
+
     async def start_server(self, model_name: str, options: dict = None):
         if model_name in self.processes:
              # Check if it's dead
@@ -287,6 +357,8 @@ class VLLMManager:
                 'served_model_name': served_name
             }
             
+            # Let the next poll see the new state immediately
+            get_vllm_service(VLLM_URL).invalidate_cache()
             return {"status": "success", "message": f"Starting {model_name} on port {port}", "port": port}
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -309,20 +381,16 @@ class VLLMManager:
             if "Zombie Process" in name and str(proc_info.get('status')) == 'zombie':
                 try:
                     # Extract PID from name "Zombie Process (12345)"
-                    import re
                     pid_match = re.search(r'\((\d+)\)', name)
                     if pid_match:
                         pid = int(pid_match.group(1))
                         # Kill it with fire
                         try:
-                            os.kill(pid, 9) # SIGKILL
+                            os.kill(pid, signal.SIGKILL)
                         except ProcessLookupError:
                             pass # Already dead
                         except Exception as e:
                             print(f"Failed to kill zombie {pid}: {e}")
-                            # Fallback to shell
-                            import subprocess
-                            subprocess.run(f"kill -9 {pid}", shell=True)
                             
                     del self.processes[name]
                     results.append(f"Killed zombie {name}")
@@ -352,11 +420,7 @@ class VLLMManager:
                         proc.kill()
 
                 # Cleanup port just in case
-                try:
-                    import subprocess
-                    pid_port = subprocess.check_output(f"lsof -t -i:{port}", shell=True).decode().strip()
-                    if pid_port: subprocess.run(f"kill -9 {pid_port}", shell=True)
-                except: pass
+                self._kill_port_listeners(port)
                 
                 del self.processes[name]
                 results.append(f"Stopped {name}")
@@ -365,6 +429,7 @@ class VLLMManager:
                 del self.processes[name]
                 results.append(f"Error stopping structure for {name}: {e}")
 
+        get_vllm_service(VLLM_URL).invalidate_cache()
         return {"status": "success", "message": ", ".join(results)}
 
     def get_status(self):
@@ -399,8 +464,13 @@ class VLLMManager:
                 # Check real connectivity to confirm it's "running"
                 # Only check if it's NOT a zombie and claims to be starting
                 if info['status'] == 'starting' and isinstance(info['port'], int):
-                     if self._is_port_in_use(info['port']):
-                         info['status'] = 'running'
+                     port = info['port']
+                     if time.monotonic() >= self._port_free_until.get(port, 0):
+                         if self._is_port_in_use(port):
+                             info['status'] = 'running'
+                             self._port_free_until.pop(port, None)
+                         else:
+                             self._port_free_until[port] = time.monotonic() + PORT_PROBE_TTL
                 
                 active_models.append({
                     "name": name,
@@ -458,6 +528,8 @@ async def chat_completion(request: dict):
     
     if not model_name:
         return {"error": "Model name is required"}
+    if not valid_messages(messages):
+        return {"error": "messages must be a non-empty list of {role, content} objects"}
     
     # 1. Find the port and served_model_name for the running model
     target_port = None
@@ -496,50 +568,76 @@ async def chat_completion(request: dict):
 
     model_to_send = target_served_name or model_name
 
+    # Open the upstream stream first so connection/HTTP errors still come back as JSON
+    upstream_request = HTTP_CLIENT.build_request(
+        "POST",
+        vllm_api_url,
+        content=orjson.dumps({
+            "model": model_to_send,
+            "messages": messages,
+            "max_tokens": 512,
+            "temperature": 0.7,
+            "stream": True
+        }),
+        headers={"Content-Type": "application/json"}
+    )
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                vllm_api_url,
-                json={
-                    "model": model_to_send,
-                    "messages": messages,
-                    "max_tokens": 512,
-                    "temperature": 0.7
-                }
-            )
-            response.raise_for_status()
-            # Sanitize response to remove internal reasoning tags (e.g., <think>...</think>)
-            try:
-                resp_json = response.json()
-            except Exception:
-                return {"error": "Invalid response from vLLM"}
-
-            # Clean message content in choices (OpenAI-like responses)
-            if isinstance(resp_json, dict) and resp_json.get("choices"):
-                for choice in resp_json.get("choices", []):
-                    # choice may have OpenAI-style message content
-                    message = choice.get("message") if isinstance(choice, dict) else None
-                    if isinstance(message, dict):
-                        content = message.get("content", "")
-                        if isinstance(content, str) and content:
-                            content = re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL)
-                            message["content"] = content.strip()
-                    # fallback: plain text field
-                    if isinstance(choice, dict) and isinstance(choice.get("text"), str):
-                        text = choice.get("text", "")
-                        text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
-                        choice["text"] = text.strip()
-
-            return resp_json
+        response = await HTTP_CLIENT.send(upstream_request, stream=True)
     except Exception as e:
         return {"error": f"Failed to communicate with vLLM on port {target_port}: {str(e)}"}
 
+    status_code = response.status_code
+    if status_code != 200:
+        detail = (await response.aread()).decode(errors="replace")[:200]
+        await response.aclose()
+        return {"error": f"vLLM on port {target_port} returned {status_code}: {detail}"}
+
+    # Relay the raw SSE lines as they arrive. Reasoning tags (<think>...</think>)
+    # are stripped by the chat UI while it assembles the streamed deltas.
+    async def relay():
+        try:
+            async for line in response.aiter_lines():
+                yield line + "\n"
+        finally:
+            await response.aclose()
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # Global state for downloads
-active_downloads = {} # { model_name: { 'status': 'downloading|done|error', 'progress': '...', 'log': '...' } }
+active_downloads = {} # { model_name: { 'status': 'downloading|done|error', 'progress': '...', 'percent': int, 'log': '...' } }
+
+# Download output parsing
+_PCT_RE = re.compile(rb'(\d+)%\|')  # tqdm bar, e.g. b" 45%|####      | 1.2G/2.5G"
+_FRAME_SPLIT_RE = re.compile(rb'[\r\n]')
+_LOG_TAIL_BYTES = 4096
+_PROGRESS_UPDATE_INTERVAL = 0.2  # seconds
+DOWNLOAD_RETENTION = 300.0  # seconds a finished/failed download stays listed
+
+
+def _schedule_download_expiry(model_name: str):
+    """Drop a finished download's entry after DOWNLOAD_RETENTION."""
+    entry = active_downloads.get(model_name)
+    def expire():
+        # Leave it alone if it was cleared or a new download replaced it
+        if active_downloads.get(model_name) is entry:
+            del active_downloads[model_name]
+    asyncio.get_running_loop().call_later(DOWNLOAD_RETENTION, expire)
+
+
+def _downloads_view() -> dict:
+    """Download state for the WebSocket payload, without the raw log line."""
+    return {
+        name: {'status': d['status'], 'progress': d['progress'], 'percent': d.get('percent', 0)}
+        for name, d in active_downloads.items()
+    }
 
 async def run_download_script(model_name: str, token: str = None):
     """Run download in a subprocess and capture output."""
-    active_downloads[model_name] = {'status': 'downloading', 'progress': 'Starting...', 'log': ''}
+    active_downloads[model_name] = {'status': 'downloading', 'progress': 'Starting...', 'percent': 0, 'log': ''}
     
     try:
         # Ensure huggingface_hub is available; provide clearer error if missing
@@ -579,23 +677,51 @@ async def run_download_script(model_name: str, token: str = None):
             env=env
         )
         
-        # Helper to read stream
+        # Helper to read stream. tqdm redraws in place with '\r', so a single
+        # "line" can hold thousands of frames; read chunks and split on both.
         async def read_stream(stream, is_stderr=False):
+            pending = b''
+            last_update = 0.0
+            latest_progress = None  # newest (percent, frame) not yet published
+            last_percent = None
             while True:
-                line = await stream.readline()
-                if not line:
-                    break
-                decoded = line.decode().strip()
-                if not decoded: continue
+                chunk = await stream.read(65536)
+                frames = _FRAME_SPLIT_RE.split(pending + chunk)
+                # Keep a trailing partial frame for the next read; flush it at EOF
+                pending = frames.pop()[-_LOG_TAIL_BYTES:] if chunk else b''
                 
-                # Update log
-                active_downloads[model_name]['log'] = decoded
+                for frame in frames:
+                    frame = frame.strip()
+                    if not frame:
+                        continue
+                    # Cheap byte check first; only frames with a '%' can be tqdm bars
+                    match = _PCT_RE.search(frame) if b'%' in frame else None
+                    if match:
+                        # Try to parse progress from stderr (tqdm usually writes to stderr)
+                        latest_progress = (int(match.group(1)), frame)
+                        continue
+                    decoded = frame[-_LOG_TAIL_BYTES:].decode(errors='replace')
+                    active_downloads[model_name]['log'] = decoded
+                    print(f"[Download {model_name}] {decoded}")
                 
-                # Try to parse progress from stderr (tqdm usually writes to stderr)
-                if '%' in decoded:
-                     active_downloads[model_name]['progress'] = decoded
+                # The dashboard only polls every STATS_INTERVAL; don't churn faster than this
+                now = time.monotonic()
+                if latest_progress and latest_progress[0] == last_percent:
+                    # Same percentage as already published: skip the decode entirely
+                    latest_progress = None
+                if latest_progress and (not chunk or now - last_update >= _PROGRESS_UPDATE_INTERVAL):
+                    last_update = now
+                    percent, frame = latest_progress
+                    latest_progress = None
+                    last_percent = percent
+                    decoded = frame[-_LOG_TAIL_BYTES:].decode(errors='replace')
+                    active_downloads[model_name]['percent'] = percent
+                    active_downloads[model_name]['progress'] = decoded
+                    active_downloads[model_name]['log'] = decoded
+                    print(f"[Download {model_name}] {decoded}")
                 
-                print(f"[Download {model_name}] {decoded}")
+                if not chunk:
+                    break
         
         await asyncio.gather(
             read_stream(process.stdout),
@@ -605,7 +731,8 @@ async def run_download_script(model_name: str, token: str = None):
         await process.wait()
         
         if process.returncode == 0:
-            active_downloads[model_name] = {'status': 'done', 'progress': 'Completed', 'log': 'Finished'}
+            active_downloads[model_name] = {'status': 'done', 'progress': 'Completed', 'percent': 100, 'log': 'Finished'}
+            get_available_models.cache_clear()
         else:
             active_downloads[model_name]['status'] = 'error'
             active_downloads[model_name]['progress'] = 'Failed'
@@ -613,6 +740,8 @@ async def run_download_script(model_name: str, token: str = None):
     except Exception as e:
         print(f"Download error: {e}")
         active_downloads[model_name] = {'status': 'error', 'progress': str(e), 'log': str(e)}
+    finally:
+        _schedule_download_expiry(model_name)
 
 @app.post("/api/vllm/download")
 async def download_model(request: dict, background_tasks: BackgroundTasks):
@@ -650,18 +779,26 @@ async def clear_download_status(request: dict = None):
             
     return {"status": "success", "message": "Download logs cleared"}
 
+def _scan_hf_cache() -> list[str]:
+    """List model repos in the HuggingFace cache directory (blocking)."""
+    models = []
+    try:
+        with os.scandir(HF_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith("models--") and entry.is_dir():
+                    # Convert models--facebook--opt-125m to facebook/opt-125m
+                    name = entry.name.replace("models--", "").replace("--", "/")
+                    models.append(name)
+    except FileNotFoundError:
+        pass
+    return models
+
+
 @app.get("/api/vllm/available-models")
+@async_ttl_cache(ttl=30.0)
 async def get_available_models():
     """List models found in HuggingFace cache."""
-    cache_dir = Path(os.path.expanduser("~/.cache/huggingface/hub"))
-    models = []
-    if cache_dir.exists():
-        for item in cache_dir.glob("models--*"):
-            if item.is_dir():
-                # Convert models--facebook--opt-125m to facebook/opt-125m
-                name = item.name.replace("models--", "").replace("--", "/")
-                models.append(name)
-    return models
+    return await asyncio.to_thread(_scan_hf_cache)
 
 @app.delete("/api/vllm/models/{model_path:path}")
 async def delete_model(model_path: str):
@@ -675,13 +812,14 @@ async def delete_model(model_path: str):
     # Convert model path to cache directory name
     # e.g., facebook/opt-125m -> models--facebook--opt-125m
     cache_name = "models--" + model_path.replace("/", "--")
-    cache_dir = Path(os.path.expanduser("~/.cache/huggingface/hub")) / cache_name
+    cache_dir = HF_CACHE_DIR / cache_name
     
     if not cache_dir.exists():
         return {"status": "error", "message": f"Model {model_path} not found in cache"}
     
     try:
         shutil.rmtree(cache_dir)
+        get_available_models.cache_clear()
         return {"status": "success", "message": f"Model {model_path} deleted successfully"}
     except Exception as e:
         return {"status": "error", "message": f"Failed to delete {model_path}: {str(e)}"}
@@ -698,26 +836,29 @@ async def health_check():
     }
 
 
+# psutil/NVML calls block, so these are plain `def` endpoints that FastAPI
+# runs in its threadpool instead of on the event loop.
+
 @app.get("/api/system/all")
-async def get_system_stats():
+def get_system_stats():
     """Get all system statistics."""
     return get_all_stats()
 
 
 @app.get("/api/system/cpu")
-async def get_cpu():
+def get_cpu():
     """Get CPU statistics."""
     return get_cpu_stats()
 
 
 @app.get("/api/system/memory")
-async def get_memory():
+def get_memory():
     """Get memory statistics."""
     return get_memory_stats()
 
 
 @app.get("/api/system/gpu")
-async def get_gpu():
+def get_gpu():
     """Get GPU statistics."""
     return get_gpu_stats()
 
@@ -778,21 +919,21 @@ async def get_vllm_metrics():
             ports.append(p)
 
     if ports:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Query each /metrics endpoint concurrently
-            tasks = [client.get(f"http://localhost:{port}/metrics") for port in ports]
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-            for resp in responses:
-                if isinstance(resp, Exception):
-                    continue
-                try:
-                    text = resp.text
-                except Exception:
-                    text = ''
-                parsed = parse_metrics_text(text)
-                aggregated['requests_total'] += parsed['requests_total']
-                aggregated['requests_running'] += parsed['requests_running']
-                aggregated['tokens_generated'] += parsed['tokens_generated']
+        # Query each /metrics endpoint concurrently
+        tasks = [HTTP_CLIENT.get(f"http://localhost:{port}/metrics", timeout=5.0) for port in ports]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        for resp in responses:
+            # Error pages carry no metrics; don't decode their bodies
+            if isinstance(resp, Exception) or resp.status_code != 200:
+                continue
+            try:
+                text = resp.text
+            except Exception:
+                text = ''
+            parsed = parse_metrics_text(text)
+            aggregated['requests_total'] += parsed['requests_total']
+            aggregated['requests_running'] += parsed['requests_running']
+            aggregated['tokens_generated'] += parsed['tokens_generated']
         return aggregated
 
     # Fallback: query the configured VLLM_URL (legacy single-server mode)
@@ -859,55 +1000,128 @@ class ConnectionManager:
             self.active_connections.remove(websocket)
     
     async def broadcast(self, data: dict):
-        """Send data to all connected clients."""
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(data)
-            except Exception:
-                dead_connections.append(connection)
+        """Send data to all connected clients concurrently."""
+        # Encode once for everyone instead of once per socket
+        message = orjson.dumps(data).decode()
+        connections = list(self.active_connections)
+        # Bound each send so a client that stopped reading can't stall the
+        # broadcaster (and with it every other dashboard)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(connection.send_text(message), timeout=STATS_INTERVAL)
+              for connection in connections),
+            return_exceptions=True
+        )
         
-        # Remove dead connections
-        for conn in dead_connections:
-            self.disconnect(conn)
+        # Drop dead or stalled connections (asyncio.TimeoutError is an Exception)
+        failed = [conn for conn, result in zip(connections, results) if isinstance(result, Exception)]
+        if failed:
+            await asyncio.gather(*(self._drop(conn) for conn in failed))
+    
+    async def _drop(self, websocket: WebSocket):
+        """Forget a failed client and close its socket so the browser reconnects."""
+        self.disconnect(websocket)
+        try:
+            # Bounded: a peer that stopped reading may never take the close frame
+            await asyncio.wait_for(websocket.close(code=1011), timeout=STATS_INTERVAL)
+        except Exception:
+            pass
 
 
 manager = ConnectionManager()
 
 
+class StatsCache:
+    """Latest monitoring snapshot shared by all WebSocket clients."""
+    
+    def __init__(self):
+        self.latest: dict = {}
+        self.published_at = 0.0
+    
+    def publish(self, payload: dict):
+        self.latest = payload
+        self.published_at = time.monotonic()
+    
+    def fresh(self, max_age: float) -> Optional[dict]:
+        """The latest snapshot, or None if it is older than max_age seconds."""
+        if self.latest and time.monotonic() - self.published_at <= max_age:
+            return self.latest
+        return None
+
+
+stats_cache = StatsCache()
+
+
+async def build_monitoring_payload(include_disks: bool = True) -> dict:
+    """Collect one monitoring snapshot (system, vLLM, models, downloads)."""
+    # System sampling is blocking psutil/NVML work, keep it off the event loop
+    stats = await asyncio.to_thread(get_all_stats, include_disks)
+    if not include_disks:
+        # Disk usage changes slowly; reuse the previous sample between refreshes
+        stats["disks"] = stats_cache.latest.get("system", {}).get("disks", [])
+    
+    # Get vLLM info (legacy connection method). Managed processes are reported
+    # under "models"; while there are some, skip VLLM_URL only if it is a local
+    # port none of them listens on. Remote servers and managed ones are polled.
+    processes = vllm_manager.processes
+    skip_legacy = processes and VLLM_URL_IS_LOCAL and not any(
+        info.get('port') == VLLM_URL_PORT for info in processes.values()
+    )
+    if not skip_legacy:
+        vllm = get_vllm_service(VLLM_URL)
+        vllm_info, vllm_metrics = await asyncio.gather(vllm.get_server_info(), vllm.get_metrics())
+    else:
+        vllm_info = vllm_metrics = None
+    
+    # Get Multi-model status
+    models_status = vllm_manager.get_status().get('models', [])
+    
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "system": stats,
+        "vllm": {
+            "server": vllm_info,
+            "metrics": vllm_metrics
+        },
+        "models": models_status,
+        "downloads": _downloads_view()
+    }
+
+
+async def monitoring_broadcaster():
+    """Sample once per tick and push the snapshot to every connected client."""
+    tick = 0
+    while True:
+        try:
+            if manager.active_connections:
+                payload = await build_monitoring_payload(include_disks=tick % DISK_REFRESH_TICKS == 0)
+                tick += 1
+                stats_cache.publish(payload)
+                await manager.broadcast(payload)
+            else:
+                # Nobody watching: the cached disks will be stale by the time
+                # someone connects, so start over with a full sample
+                tick = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Monitoring broadcaster error: {e}")
+        await asyncio.sleep(STATS_INTERVAL)
+
+
 @app.websocket("/ws/monitoring")
 async def websocket_monitoring(websocket: WebSocket):
     """WebSocket endpoint for real-time system monitoring."""
     await manager.connect(websocket)
     
     try:
+        # Send the last snapshot right away if the broadcaster is still producing
+        # them (it idles with no clients); otherwise wait for its next push.
+        # One period plus slack for the time a sample takes to build.
+        snapshot = stats_cache.fresh(max_age=2 * STATS_INTERVAL)
+        if snapshot is not None:
+            await websocket.send_text(orjson.dumps(snapshot).decode())
         while True:
-            # Get all stats
-            stats = get_all_stats()
-            
-            # Get vLLM info (legacy connection method - mostly null if multi-model)
-            vllm = get_vllm_service(VLLM_URL)
-            vllm_info = await vllm.get_server_info()
-            vllm_metrics = await vllm.get_metrics()
-            
-            # Get Multi-model status
-            models_status = vllm_manager.get_status().get('models', [])
-            
-            # Send combined data
-            await websocket.send_json({
-                "timestamp": datetime.now().isoformat(),
-                "system": stats,
-                "vllm": {
-                    "server": vllm_info,
-                    "metrics": vllm_metrics
-                },
-                "models": models_status,
-                "downloads": active_downloads
-            })
-            
-            # Wait before next update
-            await asyncio.sleep(1.5)
-            
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
@@ -920,12 +1134,17 @@ async def websocket_monitoring(websocket: WebSocket):
 if FRONTEND_DIR.exists():
     app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="assets")
     
+    # The production build is immutable, so index its files once instead of
+    # stat()-ing the requested path on every request.
+    FRONTEND_FILES = frozenset(
+        p.relative_to(FRONTEND_DIR).as_posix() for p in FRONTEND_DIR.rglob("*") if p.is_file()
+    )
+    
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str):
         """Serve the SPA for all non-API routes."""
-        file_path = FRONTEND_DIR / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
+        if full_path in FRONTEND_FILES:
+            return FileResponse(FRONTEND_DIR / full_path)
         return FileResponse(FRONTEND_DIR / "index.html")
 
 
@@ -936,6 +1155,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=BACKEND_PORT,
         reload=True,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
         access_log=False,
         log_level="info"
     )
@@ -3,6 +3,9 @@ System Monitoring Module
 Provides real-time system metrics for CPU, RAM, GPU, Disk, and Network.
 """
 
+import threading
+import time
+
 import psutil
 from typing import Optional
 from dataclasses import dataclass, asdict
@@ -15,8 +18,37 @@ try:
 except Exception:
     NVIDIA_AVAILABLE = False
 
+# Logical core count never changes while we're running
+_CPU_COUNT = psutil.cpu_count(logical=True)
+
+# Prime psutil's per-core counters so the first non-blocking sample is meaningful
+psutil.cpu_percent(interval=None, percpu=True)
+
+# psutil keeps one process-wide baseline for cpu_percent(interval=None), so
+# every caller (broadcaster, REST endpoints) shares a sample younger than this
+# instead of resetting each other's measurement window
+_CPU_SAMPLE_MIN_AGE = 0.5
+_cpu_lock = threading.Lock()
+_last_cpu_ts = time.monotonic()
+_last_per_core: list = []
+
+# Slow-moving lookups are refreshed at most once per TTL
+_TEMP_TTL = 5.0
+_last_temp_ts = 0.0
+_last_temp: Optional[float] = None
+
+_gpu_handle = None
+_gpu_name = "N/A"
+
+_PARTITIONS_TTL = 60.0
+_last_partitions_ts = 0.0
+_last_partitions: list = []
 
-@dataclass
+
+# The dataclasses document each payload's shape; the getters below build the
+# dicts directly, since asdict() walks and deep-copies fields on every tick.
+
+@dataclass(slots=True)
 class CPUStats:
     usage_percent: float
     core_count: int
@@ -25,7 +57,7 @@ class CPUStats:
     temperature: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryStats:
     total_gb: float
     used_gb: float
@@ -33,7 +65,7 @@ class MemoryStats:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GPUStats:
     available: bool
     name: str = "N/A"
@@ -45,7 +77,7 @@ class GPUStats:
     power_watts: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskStats:
     mount_point: str
     total_gb: float
@@ -54,7 +86,7 @@ class DiskStats:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStats:
     bytes_sent_mb: float
     bytes_recv_mb: float
@@ -62,13 +94,29 @@ class NetworkStats:
     packets_recv: int
 
 
-def get_cpu_stats() -> dict:
-    """Get CPU statistics."""
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    cpu_freq = psutil.cpu_freq()
-    per_core = psutil.cpu_percent(interval=0.1, percpu=True)
+# Built once; returned (copied) whenever the GPU can't be read
+_GPU_UNAVAILABLE = asdict(GPUStats(available=False))
+
+
+def _get_gpu_handle():
+    """Resolve GPU 0's handle and name once; neither changes at runtime."""
+    global _gpu_handle, _gpu_name
+    if _gpu_handle is None:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        name = pynvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode('utf-8')
+        _gpu_handle, _gpu_name = handle, name
+    return _gpu_handle, _gpu_name
+
+
+def _get_cpu_temperature() -> Optional[float]:
+    """Read the first available temperature sensor (cached for _TEMP_TTL)."""
+    global _last_temp_ts, _last_temp
+    now = time.monotonic()
+    if now - _last_temp_ts < _TEMP_TTL:
+        return _last_temp
     
-    # Try to get temperature
     temperature = None
     try:
         temps = psutil.sensors_temperatures()
@@ -80,38 +128,63 @@ def get_cpu_stats() -> dict:
     except Exception:
         pass
     
-    stats = CPUStats(
-        usage_percent=cpu_percent,
-        core_count=psutil.cpu_count(logical=True),
-        frequency_mhz=cpu_freq.current if cpu_freq else 0,
-        per_core_percent=per_core,
-        temperature=temperature
-    )
-    return asdict(stats)
+    _last_temp_ts, _last_temp = now, temperature
+    return temperature
+
+
+def _get_partitions() -> list:
+    """List mounted partitions (cached for _PARTITIONS_TTL)."""
+    global _last_partitions_ts, _last_partitions
+    now = time.monotonic()
+    if now - _last_partitions_ts >= _PARTITIONS_TTL:
+        _last_partitions_ts, _last_partitions = now, psutil.disk_partitions()
+    return _last_partitions
+
+
+def _get_per_core_percent() -> list:
+    """Per-core usage since the previous sample (reused for _CPU_SAMPLE_MIN_AGE)."""
+    global _last_cpu_ts, _last_per_core
+    with _cpu_lock:
+        now = time.monotonic()
+        if not _last_per_core or now - _last_cpu_ts >= _CPU_SAMPLE_MIN_AGE:
+            _last_cpu_ts, _last_per_core = now, psutil.cpu_percent(interval=None, percpu=True)
+        return list(_last_per_core)
+
+
+def get_cpu_stats() -> dict:
+    """Get CPU statistics."""
+    # Non-blocking: usage since the previous sample (the stats producer sets the cadence)
+    per_core = _get_per_core_percent()
+    cpu_percent = round(sum(per_core) / len(per_core), 1) if per_core else 0.0
+    cpu_freq = psutil.cpu_freq()
+    
+    return {
+        "usage_percent": cpu_percent,
+        "core_count": _CPU_COUNT,
+        "frequency_mhz": cpu_freq.current if cpu_freq else 0,
+        "per_core_percent": per_core,
+        "temperature": _get_cpu_temperature()
+    }
 
 
 def get_memory_stats() -> dict:
     """Get memory (RAM) statistics."""
     mem = psutil.virtual_memory()
-    stats = MemoryStats(
-        total_gb=round(mem.total / (1024**3), 2),
-        used_gb=round(mem.used / (1024**3), 2),
-        available_gb=round(mem.available / (1024**3), 2),
-        percent=mem.percent
-    )
-    return asdict(stats)
+    return {
+        "total_gb": round(mem.total / (1024**3), 2),
+        "used_gb": round(mem.used / (1024**3), 2),
+        "available_gb": round(mem.available / (1024**3), 2),
+        "percent": mem.percent
+    }
 
 
 def get_gpu_stats() -> dict:
     """Get GPU statistics (NVIDIA only)."""
     if not NVIDIA_AVAILABLE:
-        return asdict(GPUStats(available=False))
+        return dict(_GPU_UNAVAILABLE)
     
     try:
-        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-        name = pynvml.nvmlDeviceGetName(handle)
-        if isinstance(name, bytes):
-            name = name.decode('utf-8')
+        handle, name = _get_gpu_handle()
         
         mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
         utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
@@ -126,35 +199,33 @@ def get_gpu_stats() -> dict:
         except Exception:
             power = 0
         
-        stats = GPUStats(
-            available=True,
-            name=name,
-            memory_total_gb=round(mem_info.total / (1024**3), 2),
-            memory_used_gb=round(mem_info.used / (1024**3), 2),
-            memory_percent=round((mem_info.used / mem_info.total) * 100, 1),
-            utilization_percent=utilization.gpu,
-            temperature_c=temp,
-            power_watts=round(power, 1)
-        )
-        return asdict(stats)
+        return {
+            "available": True,
+            "name": name,
+            "memory_total_gb": round(mem_info.total / (1024**3), 2),
+            "memory_used_gb": round(mem_info.used / (1024**3), 2),
+            "memory_percent": round((mem_info.used / mem_info.total) * 100, 1),
+            "utilization_percent": utilization.gpu,
+            "temperature_c": temp,
+            "power_watts": round(power, 1)
+        }
     except Exception as e:
-        return asdict(GPUStats(available=False, name=str(e)))
+        return {**_GPU_UNAVAILABLE, "name": str(e)}
 
 
 def get_disk_stats() -> list[dict]:
     """Get disk usage for all partitions."""
     disks = []
-    for partition in psutil.disk_partitions():
+    for partition in _get_partitions():
         try:
             usage = psutil.disk_usage(partition.mountpoint)
-            stats = DiskStats(
-                mount_point=partition.mountpoint,
-                total_gb=round(usage.total / (1024**3), 2),
-                used_gb=round(usage.used / (1024**3), 2),
-                free_gb=round(usage.free / (1024**3), 2),
-                percent=usage.percent
-            )
-            disks.append(asdict(stats))
+            disks.append({
+                "mount_point": partition.mountpoint,
+                "total_gb": round(usage.total / (1024**3), 2),
+                "used_gb": round(usage.used / (1024**3), 2),
+                "free_gb": round(usage.free / (1024**3), 2),
+                "percent": usage.percent
+            })
         except PermissionError:
             continue
     return disks
@@ -163,21 +234,26 @@ def get_disk_stats() -> list[dict]:
 def get_network_stats() -> dict:
     """Get network I/O statistics."""
     net = psutil.net_io_counters()
-    stats = NetworkStats(
-        bytes_sent_mb=round(net.bytes_sent / (1024**2), 2),
-        bytes_recv_mb=round(net.bytes_recv / (1024**2), 2),
-        packets_sent=net.packets_sent,
-        packets_recv=net.packets_recv
-    )
-    return asdict(stats)
+    return {
+        "bytes_sent_mb": round(net.bytes_sent / (1024**2), 2),
+        "bytes_recv_mb": round(net.bytes_recv / (1024**2), 2),
+        "packets_sent": net.packets_sent,
+        "packets_recv": net.packets_recv
+    }
 
 
-def get_all_stats() -> dict:
-    """Get all system statistics."""
-    return {
+def get_all_stats(include_disks: bool = True) -> dict:
+    """Get all system statistics.
+
+    With include_disks=False the per-partition statvfs pass is skipped and
+    the "disks" key is left out, for callers that refresh it less often.
+    """
+    stats = {
         "cpu": get_cpu_stats(),
         "memory": get_memory_stats(),
         "gpu": get_gpu_stats(),
-        "disks": get_disk_stats(),
         "network": get_network_stats()
     }
+    if include_disks:
+        stats["disks"] = get_disk_stats()
+    return stats
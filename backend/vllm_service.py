@@ -3,122 +3,283 @@ vLLM Integration Service
 Handles communication with vLLM server for model management and metrics.
 """
 
+import asyncio
+import functools
+import threading
+import time
+
 import httpx
+import orjson
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+from cache import async_ttl_cache
+
+
+# vLLM endpoints (relative to the client's base_url)
+_HEALTH_PATH = "/health"
+_VERSION_PATH = "/version"
+_MODELS_PATH = "/v1/models"
+_METRICS_PATH = "/metrics"
+_CHAT_PATH = "/v1/chat/completions"
+
+# Prometheus metric name -> VLLMMetrics field
+_METRIC_FIELDS = {
+    "vllm:num_requests_running": "requests_running",
+    "vllm:num_requests_total": "requests_total",
+    "vllm:generation_tokens_total": "tokens_generated",
+}
+_METRIC_NAMES = frozenset(_METRIC_FIELDS)
+
+# Prefer a JSON summary if whatever serves /metrics offers one; plain vLLM
+# (prometheus_client) ignores this and answers with the text format.
+_METRICS_ACCEPT = {"Accept": "application/json, text/plain;q=0.9"}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Failures that just mean "vLLM is unreachable or answered garbage"
+_SAFE_ERRORS = (httpx.HTTPError, asyncio.TimeoutError, orjson.JSONDecodeError)
+
+
+def _safe(default_factory):
+    """Return default_factory(self, exc) instead of raising when a request fails.
+
+    Only transport, timeout and JSON decoding errors are caught; anything
+    else is a bug and should surface.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except _SAFE_ERRORS as e:
+                return default_factory(self, e)
+        return wrapper
+    return decorator
 
 
-@dataclass
+def _parse_sample_value(rest: str) -> int:
+    """Integer value of a Prometheus sample, given the text after its name/labels."""
+    # "value [timestamp]": take the first token so a timestamp is never read as the value
+    token, _, _ = rest.lstrip().partition(" ")
+    if "." in token or "e" in token or "E" in token:
+        return int(float(token))
+    return int(token)
+
+
+def valid_messages(messages) -> bool:
+    """True if messages is a non-empty list of {role, content} dicts."""
+    return (
+        isinstance(messages, list)
+        and bool(messages)
+        and all(isinstance(m, dict) and "role" in m and "content" in m for m in messages)
+    )
+
+
+@dataclass(slots=True)
 class VLLMServerInfo:
     connected: bool
     url: str
     status: str
     version: str = "unknown"
     models_loaded: int = 0
+    
+    def to_dict(self) -> dict:
+        # Flat fields only, so skip asdict()'s recursive deep copy
+        return {
+            "connected": self.connected,
+            "url": self.url,
+            "status": self.status,
+            "version": self.version,
+            "models_loaded": self.models_loaded
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class VLLMMetrics:
     requests_total: int = 0
     requests_running: int = 0
     tokens_generated: int = 0
     avg_latency_ms: float = 0.0
     throughput_tokens_per_sec: float = 0.0
+    
+    def to_dict(self) -> dict:
+        return {
+            "requests_total": self.requests_total,
+            "requests_running": self.requests_running,
+            "tokens_generated": self.tokens_generated,
+            "avg_latency_ms": self.avg_latency_ms,
+            "throughput_tokens_per_sec": self.throughput_tokens_per_sec
+        }
+
+
+# Result for every metrics failure path; built once, copied out per call
+_EMPTY_METRICS_DICT = VLLMMetrics().to_dict()
 
 
 class VLLMService:
     def __init__(self, base_url: str = "http://localhost:8001"):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # Keep connections alive across polls; fail fast if vLLM isn't listening
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(connect=2.0, read=10.0, write=5.0, pool=5.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+        )
+        self._closed = False
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._models_cache: Optional[tuple[float, list[dict]]] = None
+        self._models_ttl = 10.0
+        # Bound once; every request path goes through these
+        self._get = self.client.get
+        self._post = self.client.post
+        self._stream = self.client.stream
     
+    async def _coalesce(self, key: str, coro_fn):
+        """Share one in-flight request per key between concurrent callers."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller going away doesn't cancel the request for the rest
+        return await asyncio.shield(task)
+    
+    @async_ttl_cache(ttl=1.0)
     async def get_server_info(self) -> dict:
         """Get vLLM server status and info."""
-        try:
-            response = await self.client.get(f"{self.base_url}/health")
-            if response.status_code == 200:
-                # Try to get version info
-                version = "unknown"
-                try:
-                    version_resp = await self.client.get(f"{self.base_url}/version")
-                    if version_resp.status_code == 200:
-                        version = version_resp.json().get("version", "unknown")
-                except Exception:
-                    pass
-                
-                info = VLLMServerInfo(
-                    connected=True,
-                    url=self.base_url,
-                    status="running",
-                    version=version
-                )
-                return asdict(info)
-            else:
-                return asdict(VLLMServerInfo(
-                    connected=False,
-                    url=self.base_url,
-                    status=f"error: {response.status_code}"
-                ))
-        except Exception as e:
-            return asdict(VLLMServerInfo(
+        return await self._coalesce("server_info", self._fetch_server_info)
+    
+    @_safe(lambda self, e: VLLMServerInfo(
+        connected=False,
+        url=self.base_url,
+        status=f"disconnected: {str(e)[:50]}"
+    ).to_dict())
+    async def _fetch_server_info(self) -> dict:
+        # Probe health and version concurrently; version is best-effort
+        response, version_resp = await asyncio.gather(
+            self._get(_HEALTH_PATH),
+            self._get(_VERSION_PATH),
+            return_exceptions=True
+        )
+        if isinstance(response, BaseException):
+            raise response
+        status_code = response.status_code
+        if status_code != 200:
+            return VLLMServerInfo(
                 connected=False,
                 url=self.base_url,
-                status=f"disconnected: {str(e)[:50]}"
-            ))
+                status=f"error: {status_code}"
+            ).to_dict()
+        
+        # Try to get version info
+        version = "unknown"
+        try:
+            if not isinstance(version_resp, BaseException) and version_resp.status_code == 200:
+                version = orjson.loads(version_resp.content).get("version", "unknown")
+        except Exception:
+            pass
+        
+        return VLLMServerInfo(
+            connected=True,
+            url=self.base_url,
+            status="running",
+            version=version
+        ).to_dict()
     
     async def get_models(self) -> list[dict]:
         """Get list of available models."""
-        try:
-            response = await self.client.get(f"{self.base_url}/v1/models")
-            if response.status_code == 200:
-                data = response.json()
-                models = data.get("data", [])
-                return [
-                    {
-                        "id": m.get("id", "unknown"),
-                        "object": m.get("object", "model"),
-                        "owned_by": m.get("owned_by", "vllm"),
-                        "created": m.get("created", 0)
-                    }
-                    for m in models
-                ]
+        # The model list only changes when vLLM restarts; serve it from cache
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < self._models_ttl:
+            return cached[1]
+        return await self._coalesce("models", self._fetch_models)
+    
+    def _models_unavailable(self, exc: Exception) -> list:
+        """_fetch_models fallback: forget the cached list and report none."""
+        self._models_cache = None
+        return []
+    
+    @_safe(_models_unavailable)
+    async def _fetch_models(self) -> list[dict]:
+        response = await self._get(_MODELS_PATH)
+        if response.status_code != 200:
+            self._models_cache = None
             return []
-        except Exception:
+        
+        data = orjson.loads(response.content)
+        # Valid JSON of the wrong shape is garbage too, not a server error
+        models = data.get("data") if isinstance(data, dict) else None
+        if not isinstance(models, list):
+            self._models_cache = None
             return []
+        result = [
+            {
+                "id": m.get("id", "unknown"),
+                "object": m.get("object", "model"),
+                "owned_by": m.get("owned_by", "vllm"),
+                "created": m.get("created", 0)
+            }
+            for m in models
+            if isinstance(m, dict)
+        ]
+        self._models_cache = (time.monotonic(), result)
+        return result
     
+    @async_ttl_cache(ttl=1.0)
     async def get_metrics(self) -> dict:
         """Get vLLM performance metrics."""
-        try:
-            response = await self.client.get(f"{self.base_url}/metrics")
-            if response.status_code == 200:
-                # Parse Prometheus-style metrics
-                text = response.text
-                metrics = VLLMMetrics()
+        return await self._coalesce("metrics", self._fetch_metrics)
+    
+    @_safe(lambda self, e: dict(_EMPTY_METRICS_DICT))
+    async def _fetch_metrics(self) -> dict:
+        # Stream the Prometheus text and stop once every metric we use is seen,
+        # instead of materializing the whole (histogram-heavy) body.
+        async with self._stream("GET", _METRICS_PATH, headers=_METRICS_ACCEPT) as response:
+            if response.status_code != 200:
+                return dict(_EMPTY_METRICS_DICT)
+            
+            metrics = VLLMMetrics()
+            
+            if response.headers.get("content-type", "").startswith("application/json"):
+                # A JSON summary ({"vllm:...": value}) needs no line parsing at all
+                data = orjson.loads(await response.aread())
+                for name, field in _METRIC_FIELDS.items():
+                    value = data.get(name) if isinstance(data, dict) else None
+                    if isinstance(value, (int, float)):
+                        setattr(metrics, field, int(value))
+                return metrics.to_dict()
+            
+            needed = set(_METRIC_NAMES)
+            
+            async for line in response.aiter_lines():
+                if not line or line[0] == "#":
+                    continue
                 
-                for line in text.split("\n"):
-                    if line.startswith("#") or not line.strip():
-                        continue
-                    
-                    if "vllm:num_requests_running" in line:
-                        try:
-                            metrics.requests_running = int(float(line.split()[-1]))
-                        except ValueError:
-                            pass
-                    elif "vllm:num_requests_total" in line:
-                        try:
-                            metrics.requests_total = int(float(line.split()[-1]))
-                        except ValueError:
-                            pass
-                    elif "vllm:generation_tokens_total" in line:
-                        try:
-                            metrics.tokens_generated = int(float(line.split()[-1]))
-                        except ValueError:
-                            pass
+                # "name{labels} value [timestamp]" -> look the bare name up once
+                name, _, rest = line.partition(" ")
+                brace = name.find("{")
+                if brace != -1:
+                    name = name[:brace]
+                field = _METRIC_FIELDS.get(name)
+                if field is None or name not in needed:
+                    continue
+                if brace != -1:
+                    # Label values may contain spaces; the sample follows the closing brace
+                    rest = line[line.rfind("}") + 1:]
                 
-                return asdict(metrics)
-            return asdict(VLLMMetrics())
-        except Exception:
-            return asdict(VLLMMetrics())
+                try:
+                    setattr(metrics, field, _parse_sample_value(rest))
+                except (ValueError, OverflowError):
+                    continue
+                
+                needed.discard(name)
+                if not needed:
+                    break
+            
+            return metrics.to_dict()
     
+    @_safe(lambda self, e: None)
     async def chat_completions(
         self,
         messages: list[dict],
@@ -127,34 +288,60 @@ class VLLMService:
         temperature: float = 0.7
     ) -> Optional[dict]:
         """Send chat completion request to vLLM."""
-        try:
-            response = await self.client.post(
-                f"{self.base_url}/v1/chat/completions",
-                json={
-                    "model": model,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
-                    "temperature": temperature
-                }
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
-        except Exception:
+        # vLLM would only answer these with a 4xx; don't spend a round trip on them
+        if not valid_messages(messages):
             return None
+        # orjson writes UTF-8 bytes directly, no intermediate str like json=
+        body = orjson.dumps({
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        })
+        response = await self._post(_CHAT_PATH, content=body, headers=_JSON_HEADERS)
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        return None
+    
+    def invalidate_cache(self):
+        """Drop cached server info/metrics/models so the next poll hits vLLM."""
+        VLLMService.get_server_info.cache_clear()
+        VLLMService.get_metrics.cache_clear()
+        self._models_cache = None
     
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client (safe to call more than once)."""
+        if self._closed:
+            return
+        self._closed = True
         await self.client.aclose()
 
 
 # Singleton instance
 _vllm_service: Optional[VLLMService] = None
+_vllm_lock = threading.Lock()
 
 
 def get_vllm_service(base_url: str = "http://localhost:8001") -> VLLMService:
     """Get or create vLLM service instance."""
     global _vllm_service
-    if _vllm_service is None:
-        _vllm_service = VLLMService(base_url)
-    return _vllm_service
+    # Fast path: no lock once the singleton exists
+    service = _vllm_service
+    if service is not None:
+        return service
+    with _vllm_lock:
+        # Re-check so concurrent first calls don't each build a client pool
+        if _vllm_service is None:
+            _vllm_service = VLLMService(base_url)
+        return _vllm_service
+
+
+async def shutdown_vllm_service():
+    """Close and forget the singleton so its connection pool is released."""
+    global _vllm_service
+    with _vllm_lock:
+        service, _vllm_service = _vllm_service, None
+    if service is not None:
+        # The TTL caches key on self; clear them or they keep the service alive
+        service.invalidate_cache()
+        await service.close()
@@ -1,9 +1,18 @@
 import React, { useState, useEffect, useRef } from 'react';
 
+// Hide internal reasoning (<think>...</think>), including a block still being streamed
+function stripReasoning(text) {
+    return text
+        .replace(/<think>[\s\S]*?<\/think>/g, '')
+        .replace(/<think>[\s\S]*$/, '')
+        .trim();
+}
+
 export function ChatInterface() {
     const [messages, setMessages] = useState([]);
     const [input, setInput] = useState('');
     const [loading, setLoading] = useState(false);
+    const [streaming, setStreaming] = useState(false);
     const [models, setModels] = useState([]);
     const [selectedModel, setSelectedModel] = useState('');
     const messagesEndRef = useRef(null);
@@ -89,26 +98,67 @@ export function ChatInterface() {
                 })
             });
 
-            let data = null;
-            try {
-                const text = await response.text();
-                data = text ? JSON.parse(text) : { error: 'Empty response' };
-            } catch (e) {
-                data = { error: 'Invalid JSON response from server' };
+            // Errors come back as plain JSON; completions are streamed as SSE
+            const contentType = response.headers.get('content-type') || '';
+            if (!contentType.includes('text/event-stream')) {
+                let data = null;
+                try {
+                    const text = await response.text();
+                    data = text ? JSON.parse(text) : { error: 'Empty response' };
+                } catch (e) {
+                    data = { error: 'Invalid JSON response from server' };
+                }
+                setMessages(prev => [...prev, { role: 'assistant', content: `Error: ${data.error || 'Unexpected response'}` }]);
+                return;
             }
 
-            if (data.error) {
-                setMessages(prev => [...prev, { role: 'assistant', content: `Error: ${data.error}` }]);
-            } else {
-                // Assuming standard OpenAI format response
-                const reply = data.choices?.[0]?.message?.content || "No response received.";
-                setMessages(prev => [...prev, { role: 'assistant', content: reply }]);
+            // Show the reply as soon as the first token arrives
+            setMessages(prev => [...prev, { role: 'assistant', content: '' }]);
+            setStreaming(true);
+
+            const updateReply = (content) => {
+                setMessages(prev => {
+                    const next = [...prev];
+                    next[next.length - 1] = { role: 'assistant', content };
+                    return next;
+                });
+            };
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            let raw = '';
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                for (const line of lines) {
+                    if (!line.startsWith('data:')) continue;
+                    const payload = line.slice(5).trim();
+                    if (!payload || payload === '[DONE]') continue;
+                    try {
+                        // Standard OpenAI streaming chunk
+                        const chunk = JSON.parse(payload);
+                        if (chunk.error) {
+                            raw += `\nError: ${chunk.error.message || chunk.error}`;
+                        } else {
+                            raw += chunk.choices?.[0]?.delta?.content || '';
+                        }
+                    } catch (e) {
+                        console.warn('Failed to parse stream chunk', e);
+                    }
+                }
+                updateReply(stripReasoning(raw));
             }
+            updateReply(stripReasoning(raw) || "No response received.");
 
         } catch (error) {
             setMessages(prev => [...prev, { role: 'assistant', content: "Error: Failed to communicate with server." }]);
         } finally {
             setLoading(false);
+            setStreaming(false);
         }
     };
 
@@ -179,7 +229,7 @@ export function ChatInterface() {
                         </div>
                     ))}
 
-                    {loading && (
+                    {loading && !streaming && (
                         <div className="flex justify-start">
                             <div className="bg-surface border border-white/10 text-gray-100 rounded-2xl rounded-tl-none px-5 py-4 flex items-center gap-2">
                                 <div className="w-2 h-2 bg-gray-400 rounded-full animate-bounce"></div>
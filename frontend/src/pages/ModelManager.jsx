@@ -534,8 +534,8 @@ function DownloadModelCard({ downloads }) {
                             {status.status}
                         </span>
                     </div>
-                    <div className="text-white truncate" title={status.log}>
-                        {status.progress || status.log || 'Initializing...'}
+                    <div className="text-white truncate" title={status.progress}>
+                        {status.progress || 'Initializing...'}
                     </div>
 
                     {status.status !== 'downloading' && (